@@ -13,8 +13,9 @@ x_dot = A*x + B*u
 A depends on longitudinal speed, u [m/s], and vehicle parameters CP
 """
 
+from collections.abc import Callable
+
 import numpy as np
-from numpy.linalg import solve
 
 from cereal import car
 
@@ -37,14 +38,33 @@ class VehicleModel:
 
     self.cF_orig: float = CP.tireStiffnessFront
     self.cR_orig: float = CP.tireStiffnessRear
+    self._params_key: tuple[float, float] | None = None
     self.update_params(1.0, CP.steerRatio)
 
   def update_params(self, stiffness_factor: float, steer_ratio: float) -> None:
     """Update the vehicle model with a new stiffness factor and steer ratio"""
+    # called every tick with the live params, which rarely change
+    if (stiffness_factor, steer_ratio) == self._params_key:
+      return
+    self._params_key = (stiffness_factor, steer_ratio)
+
     self.cF: float = stiffness_factor * self.cF_orig
     self.cR: float = stiffness_factor * self.cR_orig
     self.sR: float = steer_ratio
 
+    # these only change with the params, so cache them off the per-tick path
+    self._slip_factor: float = self.m * (self.cF * self.aF - self.cR * self.aR) / (self.l**2 * self.cF * self.cR)
+    self._one_minus_chi_over_l: float = (1. - self.chi) / self.l
+
+    # speed-independent coefficients of the dynamics matrices
+    self._c_sum: float = self.cF + self.cR
+    self._c_diff: float = self.cF * self.aF - self.cR * self.aR
+    self._c_sq: float = self.cF * self.aF**2 + self.cR * self.aR**2
+    self._b0: float = (self.cF + self.chi * self.cR) / (self.m * self.sR)
+    self._b1: float = (self.cF * self.aF - self.chi * self.cR * self.aR) / (self.j * self.sR)
+
+    self._dyn_ss = _make_dyn_ss_sol(self.m, self.j, self._c_sum, self._c_diff, self._c_sq, self._b0, self._b1)
+
   def steady_state_sol(self, sa: float, u: float, roll: float) -> np.ndarray:
     """Returns the steady state solution.
 
@@ -59,10 +79,24 @@ class VehicleModel:
     Returns:
       2x1 matrix with steady state solution (lateral speed, rotational speed)
     """
+    v, r = self.steady_state_sol_v_r(sa, u, roll)
+    return np.array([[v], [r]])
+
+  def steady_state_sol_v_r(self, sa: float, u: float, roll: float) -> tuple[float, float]:
+    """Scalar variant of steady_state_sol for callers that don't need the matrix form.
+
+    Args:
+      sa: Steering wheel angle [rad]
+      u: Speed [m/s]
+      roll: Road Roll [rad]
+
+    Returns:
+      Tuple with steady state solution (lateral speed [m/s], rotational speed [rad/s])
+    """
     if u > 0.1:
-      return dyn_ss_sol(sa, u, roll, self)
+      return self._dyn_ss(sa, u, roll)
     else:
-      return kin_ss_sol(sa, u, self)
+      return _kin_ss_sol_scalar(sa, u, self)
 
   def calc_curvature(self, sa: float, u: float, roll: float) -> float:
     """Returns the curvature. Multiplied by the speed this will give the yaw rate.
@@ -87,8 +121,7 @@ class VehicleModel:
     Returns:
       Curvature factor [1/m]
     """
-    sf = calc_slip_factor(self)
-    return (1. - self.chi) / (1. - sf * u**2) / self.l
+    return self._one_minus_chi_over_l / (1. - self._slip_factor * u**2)
 
   def get_steer_from_curvature(self, curv: float, u: float, roll: float) -> float:
     """Calculates the required steering wheel angle for a given curvature
@@ -114,10 +147,14 @@ class VehicleModel:
     Returns:
       Roll compensation curvature [rad]
     """
-    sf = calc_slip_factor(self)
+    # flat road is the common case
+    if abs(roll) < 1e-4:
+      return 0.0
+
+    sf = self._slip_factor
 
     if abs(sf) < 1e-6:
-      return 0
+      return 0.0
     else:
       return (ACCELERATION_DUE_TO_GRAVITY * roll) / ((1 / sf) - u**2)
 
@@ -162,10 +199,14 @@ def kin_ss_sol(sa: float, u: float, VM: VehicleModel) -> np.ndarray:
   Returns:
     2x1 matrix with steady state solution
   """
-  K = np.zeros((2, 1))
-  K[0, 0] = VM.aR / VM.sR / VM.l * u
-  K[1, 0] = 1. / VM.sR / VM.l * u
-  return K * sa
+  v, r = _kin_ss_sol_scalar(sa, u, VM)
+  return np.array([[v], [r]])
+
+
+def _kin_ss_sol_scalar(sa: float, u: float, VM: VehicleModel) -> tuple[float, float]:
+  """Scalar version of kin_ss_sol returning (v, r) as plain floats"""
+  r = 1. / VM.sR / VM.l * u * sa
+  return VM.aR * r, r
 
 
 def create_dyn_state_matrices(u: float, VM: VehicleModel) -> tuple[np.ndarray, np.ndarray]:
@@ -188,23 +229,48 @@ def create_dyn_state_matrices(u: float, VM: VehicleModel) -> tuple[np.ndarray, n
     sR: Steering ratio [-]
     chi: Steer ratio rear [-]
   """
-  A = np.zeros((2, 2))
-  B = np.zeros((2, 2))
-  A[0, 0] = - (VM.cF + VM.cR) / (VM.m * u)
-  A[0, 1] = - (VM.cF * VM.aF - VM.cR * VM.aR) / (VM.m * u) - u
-  A[1, 0] = - (VM.cF * VM.aF - VM.cR * VM.aR) / (VM.j * u)
-  A[1, 1] = - (VM.cF * VM.aF**2 + VM.cR * VM.aR**2) / (VM.j * u)
+  inv_mu = 1. / (VM.m * u)
+  inv_ju = 1. / (VM.j * u)
 
-  # Steering input
-  B[0, 0] = (VM.cF + VM.chi * VM.cR) / VM.m / VM.sR
-  B[1, 0] = (VM.cF * VM.aF - VM.chi * VM.cR * VM.aR) / VM.j / VM.sR
+  A = np.array([[-VM._c_sum * inv_mu, -VM._c_diff * inv_mu - u],
+                [-VM._c_diff * inv_ju, -VM._c_sq * inv_ju]])
 
-  # Roll input
-  B[0, 1] = -ACCELERATION_DUE_TO_GRAVITY
+  # columns are the steering and roll inputs
+  B = np.array([[VM._b0, -ACCELERATION_DUE_TO_GRAVITY],
+                [VM._b1, 0.]])
 
   return A, B
 
 
+def _make_dyn_ss_sol(m: float, j: float, c_sum: float, c_diff: float, c_sq: float,
+                     b0: float, b1: float) -> Callable[[float, float, float], tuple[float, float]]:
+  """Build a steady state solver specialized to one set of vehicle params.
+
+  The parameter-derived coefficients are captured in the closure, so each
+  call is plain scalar math on (sa, u, roll) with no attribute lookups,
+  numpy arrays or dispatch in between. Rebuilt by update_params whenever
+  the params actually change.
+  """
+  def dyn_ss_sol_scalar(sa: float, u: float, roll: float) -> tuple[float, float]:
+    inv_mu = 1. / (m * u)
+    inv_ju = 1. / (j * u)
+
+    a00 = -c_sum * inv_mu
+    a01 = -c_diff * inv_mu - u
+    a10 = -c_diff * inv_ju
+    a11 = -c_sq * inv_ju
+
+    in0 = b0 * sa - ACCELERATION_DUE_TO_GRAVITY * roll
+    in1 = b1 * sa
+
+    det = a00 * a11 - a01 * a10
+    v = -(a11 * in0 - a01 * in1) / det
+    r = -(a00 * in1 - a10 * in0) / det
+    return v, r
+
+  return dyn_ss_sol_scalar
+
+
 def dyn_ss_sol(sa: float, u: float, roll: float, VM: VehicleModel) -> np.ndarray:
   """Calculate the steady state solution when x_dot = 0,
   Ax + Bu = 0 => x = -A^{-1} B u
@@ -218,13 +284,12 @@ def dyn_ss_sol(sa: float, u: float, roll: float, VM: VehicleModel) -> np.ndarray
   Returns:
     2x1 matrix with steady state solution
   """
-  A, B = create_dyn_state_matrices(u, VM)
-  inp = np.array([[sa], [roll]])
-  return -solve(A, B) @ inp  # type: ignore
+  v, r = VM._dyn_ss(sa, u, roll)
+  return np.array([[v], [r]])
 
 
 def calc_slip_factor(VM: VehicleModel) -> float:
   """The slip factor is a measure of how the curvature changes with speed
   it's positive for Oversteering vehicle, negative (usual case) otherwise.
   """
-  return VM.m * (VM.cF * VM.aF - VM.cR * VM.aR) / (VM.l**2 * VM.cF * VM.cR)
+  return VM._slip_factor